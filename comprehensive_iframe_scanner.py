@@ -9,16 +9,151 @@ This tool automatically:
 4. No need to specify locator strategies - tries everything automatically
 """
 
-import time
+import json
 import logging
-from typing import List, Dict, Any
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
+from urllib.parse import quote
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, JavascriptException
 from dataclasses import dataclass
+from scan_common import build_search_strategies, frame_identifier
+
+# Configure logging once per process rather than on every scanner instance
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+# Markup that can put text on the page which is not literally in the source:
+# scripts, inline event handlers, javascript: URLs, externally loaded
+# frames/objects, redirects and character references
+_INDIRECT_CONTENT_RE = re.compile(
+    r'<script|\bon[a-z]+\s*=|javascript:|<object|<embed|\bsrc\s*=|http-equiv|&',
+    re.IGNORECASE
+)
+
+def source_lacks_text(html_source: str, search_text: str) -> bool:
+    """Tell whether search_text cannot appear once html_source is loaded.
+
+    A conservative check: any source matching _INDIRECT_CONTENT_RE may produce
+    text at load time and is never ruled out, so only static markup is skipped.
+    """
+    if _INDIRECT_CONTENT_RE.search(html_source):
+        return False
+    # The first-word strategy matches on less than the full text; every other
+    # strategy needs text that includes the first word, so checking it suffices
+    words = search_text.split()
+    first_word = words[0] if words else search_text
+    return first_word.lower() not in html_source.lower()
+
+# In-page XPath builder shared by every script that needs element XPaths.
+# Walks up iteratively and caches each ancestor's XPath, so elements that
+# share ancestors within one script call reuse the same prefix.
+_XPATH_JS = """
+    var xpathCache = new Map();
+    function getElementXPath(element) {
+        var steps = [];
+        var node = element;
+        var path = '';
+        while (node) {
+            if (xpathCache.has(node)) {
+                path = xpathCache.get(node);
+                break;
+            }
+            if (node.id !== '') {
+                path = "//*[@id='" + node.id + "']";
+                xpathCache.set(node, path);
+                break;
+            }
+            if (node === document.body || !node.parentElement) {
+                path = node === document.body ? '/html/body' : '/' + node.tagName.toLowerCase();
+                xpathCache.set(node, path);
+                break;
+            }
+            var ix = 1;
+            for (var sibling = node.previousElementSibling; sibling; sibling = sibling.previousElementSibling) {
+                if (sibling.tagName === node.tagName) {
+                    ix++;
+                }
+            }
+            steps.push([node, '/' + node.tagName.toLowerCase() + '[' + ix + ']']);
+            node = node.parentElement;
+        }
+        for (var i = steps.length - 1; i >= 0; i--) {
+            path += steps[i][1];
+            xpathCache.set(steps[i][0], path);
+        }
+        return path;
+    }
+"""
+
+# Collects every frame in the current context with its attributes in one round-trip
+_FRAME_DISCOVERY_JS = _XPATH_JS + """
+    var frames = document.querySelectorAll('iframe, frame');
+    var records = [];
+    for (var i = 0; i < frames.length; i++) {
+        var frame = frames[i];
+        records.push({
+            element: frame,
+            id: frame.id || '',
+            name: frame.name || '',
+            src: frame.src || '',
+            title: frame.title || '',
+            className: frame.className || '',
+            xpath: getElementXPath(frame) || ''
+        });
+    }
+    return records;
+"""
+
+# Evaluates the XPath strategies plus a text-node walk for the nested-text
+# strategy, returning one record per unique match
+_SEARCH_JS = _XPATH_JS + """
+    var seen = new Set();
+    var matches = [];
+    function addMatch(node) {
+        var xpath = getElementXPath(node) || '';
+        if (seen.has(xpath)) {
+            return;
+        }
+        seen.add(xpath);
+        matches.push({
+            xpath: xpath,
+            tagName: node.tagName.toLowerCase(),
+            text: (node.innerText || '').trim().slice(0, 100)
+        });
+    }
+    
+    var result = document.evaluate(arguments[0], document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < result.snapshotLength; i++) {
+        var node = result.snapshotItem(i);
+        if (node.nodeType === 1) {
+            addMatch(node);
+        }
+    }
+    
+    // Visit each text node once instead of //*[contains(., ...)], which
+    // re-reads the concatenated text of every ancestor
+    var needle = arguments[1].toLowerCase();
+    if (needle && document.body) {
+        var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, null);
+        var textNode;
+        while ((textNode = walker.nextNode())) {
+            if (textNode.parentElement && textNode.data.toLowerCase().indexOf(needle) !== -1) {
+                addMatch(textNode.parentElement);
+            }
+        }
+    }
+    return matches;
+"""
 
 @dataclass
 class IframeInfo:
@@ -30,7 +165,7 @@ class IframeInfo:
     title: str
     class_name: str
     xpath: str
-    hierarchy_path: List[str]
+    hierarchy_path: Tuple[str, ...]
     is_accessible: bool
     error_message: str = ""
     content_preview: str = ""
@@ -45,25 +180,22 @@ class ComprehensiveIframeScanner:
     Comprehensive iframe discovery and text search tool.
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 15):
+    def __init__(self, headless: bool = True, timeout: int = 15, workers: int = 1, driver=None):
+        self.headless = headless
         self.timeout = timeout
+        self.workers = max(1, workers)
         self.driver = None
         self.wait = None
-        self.discovered_iframes = []
-        self.search_results = {}
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
         self.logger = logging.getLogger(__name__)
         
-        # Setup WebDriver
-        self._setup_driver(headless)
+        # Setup WebDriver, unless a running one (e.g. from a pool) is supplied
+        self.attach(driver if driver is not None else self.build_driver(headless))
     
-    def _setup_driver(self, headless: bool):
-        """Setup Chrome WebDriver."""
+    @staticmethod
+    def build_driver(headless: bool = True) -> webdriver.Chrome:
+        """Start a Chrome WebDriver configured for scanning."""
+        logger = logging.getLogger(__name__)
         try:
             chrome_options = Options()
             if headless:
@@ -74,14 +206,33 @@ class ComprehensiveIframeScanner:
             chrome_options.add_argument("--disable-features=VizDisplayCompositor")
             chrome_options.add_argument("--window-size=1920,1080")
             
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.wait = WebDriverWait(self.driver, self.timeout)
-            self.logger.info("✅ WebDriver initialized successfully")
+            # Only the DOM is needed, so skip image downloads and background traffic
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+            })
+            # Return from driver.get at DOMContentLoaded; _wait_for_page_ready does the rest
+            chrome_options.page_load_strategy = 'eager'
+            
+            driver = webdriver.Chrome(options=chrome_options)
+            logger.info("✅ WebDriver initialized successfully")
+            return driver
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize WebDriver: {str(e)}")
+            logger.error("❌ Failed to initialize WebDriver: %s", e)
             raise
     
+    def attach(self, driver):
+        """Use the given WebDriver for subsequent scans and reset per-scan state."""
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, self.timeout)
+        self.discovered_iframes = []
+        self.search_results = {}
+        self._source = (None, None)
+        self._frame_depth = 0
+        self._cdp_available = True
+    
     def scan_page(self, url: str = None, html_source: str = None, search_text: str = None) -> Dict[str, Any]:
         """
         Comprehensive page scan - discover iframes and optionally search for text.
@@ -96,27 +247,32 @@ class ComprehensiveIframeScanner:
         """
         try:
             if url:
-                self.logger.info(f"🔍 Starting comprehensive scan of URL: {url}")
-                # Load the page
-                self.driver.get(url)
-                self.logger.info("📄 Page loaded, waiting for content...")
-                time.sleep(3)
+                self.logger.info("🔍 Starting comprehensive scan of URL: %s", url)
             elif html_source:
-                self.logger.info(f"🔍 Starting comprehensive scan of provided DOM/HTML source")
-                # Load HTML source directly
-                self._load_html_source(html_source)
-                self.logger.info("📄 HTML source loaded")
+                self.logger.info("🔍 Starting comprehensive scan of provided DOM/HTML source")
             else:
                 raise ValueError("Either URL or HTML source must be provided")
             
+            self._source = (url, html_source)
+            self._load_page(url, html_source)
+            
             # Discover all iframes
             self.logger.info("🖼️  Discovering iframes...")
             self._discover_all_iframes()
             
             # Search for text if provided
             if search_text:
-                self.logger.info(f"🔎 Searching for text: '{search_text}'")
-                self._search_text_everywhere(search_text)
+                if html_source and not url and source_lacks_text(html_source, search_text):
+                    # Nothing on the page can contain it, skip the per-frame search
+                    self.logger.info("ℹ️  '%s' does not occur in the provided source, skipping search", search_text)
+                    self.search_results = {
+                        'search_text': search_text,
+                        'total_locations_found': 0,
+                        'locations': []
+                    }
+                else:
+                    self.logger.info("🔎 Searching for text: '%s'", search_text)
+                    self._search_text_everywhere(search_text)
             
             # Generate comprehensive report
             report = self._generate_report(search_text)
@@ -124,20 +280,57 @@ class ComprehensiveIframeScanner:
             return report
             
         except Exception as e:
-            self.logger.error(f"❌ Error during scan: {str(e)}")
+            self.logger.error("❌ Error during scan: %s", e)
             raise
         finally:
             self._return_to_main_context()
     
+    def _load_page(self, url: str = None, html_source: str = None):
+        """Load a URL, or the HTML source when no URL is given."""
+        if url:
+            self.driver.get(url)
+            self.logger.info("📄 Page loaded, waiting for content...")
+            self._wait_for_page_ready()
+        else:
+            # Load HTML source directly
+            self._load_html_source(html_source)
+            self.logger.info("📄 HTML source loaded")
+            self._wait_for_page_ready()
+    
+    def _wait_for_page_ready(self):
+        """Wait until the document has loaded and its iframe count stops changing."""
+        last_count = [-1]
+        
+        def frames_settled(driver):
+            count = self._eval_js("return document.querySelectorAll('iframe, frame').length")
+            settled = count == last_count[0]
+            last_count[0] = count
+            return settled
+        
+        try:
+            self.wait.until(lambda d: self._eval_js("return document.readyState") == "complete")
+            self.wait.until(frames_settled)
+        except TimeoutException:
+            self.logger.warning("⚠️  Timed out waiting for page to settle, scanning current DOM")
+    
     def _load_html_source(self, html_source: str):
         """Load HTML source directly into the browser."""
         try:
-            # Create a data URL with the HTML content
-            data_url = f"data:text/html;charset=utf-8,{html_source}"
-            self.driver.get(data_url)
+            try:
+                # Replace a blank document's content over CDP, avoiding URL size limits
+                self.driver.get("about:blank")
+                frame_tree = self.driver.execute_cdp_cmd("Page.getFrameTree", {})
+                self.driver.execute_cdp_cmd("Page.setDocumentContent", {
+                    "frameId": frame_tree["frameTree"]["frame"]["id"],
+                    "html": html_source
+                })
+            except (WebDriverException, AttributeError, KeyError):
+                # No CDP available, fall back to a properly encoded data URL
+                data_url = f"data:text/html;charset=utf-8,{quote(html_source, safe='')}"
+                self.driver.get(data_url)
             self.logger.info("✅ HTML source loaded successfully")
         except Exception as e:
-            self.logger.error(f"❌ Failed to load HTML source: {str(e)}")
+            self.logger.error("❌ Failed to load HTML source: %s", e)
             raise
     
     def _discover_all_iframes(self, current_path: List[str] = None, depth: int = 0):
@@ -146,71 +339,66 @@ class ComprehensiveIframeScanner:
             current_path = ["main_page"]
         
         if depth > 10:  # Prevent infinite recursion
-            self.logger.warning(f"⚠️  Maximum iframe depth reached: {depth}")
+            self.logger.warning("⚠️  Maximum iframe depth reached: %d", depth)
             return
         
         try:
-            # Find all iframe and frame elements
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            frames = self.driver.find_elements(By.TAG_NAME, "frame")
-            all_frames = iframes + frames
+            # Fetch all iframe and frame records in a single script call
+            records = self.driver.execute_script(_FRAME_DISCOVERY_JS) or []
             
-            self.logger.info(f"📊 Found {len(all_frames)} iframe(s) at depth {depth}")
+            self.logger.info("📊 Found %d iframe(s) at depth %d", len(records), depth)
             
-            for i, frame in enumerate(all_frames):
-                frame_info = self._extract_iframe_info(frame, i, current_path, depth)
+            for i, record in enumerate(records):
+                frame_info = self._extract_iframe_info(record, i, current_path, depth)
                 self.discovered_iframes.append(frame_info)
                 
                 # Try to access the iframe content
                 if frame_info.is_accessible:
                     try:
-                        self.logger.info(f"🔍 Accessing iframe: {' → '.join(frame_info.hierarchy_path)}")
+                        self.logger.info("🔍 Accessing iframe: %s", ' → '.join(frame_info.hierarchy_path))
                         
                         # Switch to iframe
-                        self.driver.switch_to.frame(frame)
+                        self.driver.switch_to.frame(record['element'])
+                        self._frame_depth += 1
                         
                         # Get content preview
                         frame_info.content_preview = self._get_content_preview()
                         
-                        # Recursively check for nested iframes
-                        nested_path = current_path + [frame_info.xpath.split('/')[-1]]
-                        self._discover_all_iframes(nested_path, depth + 1)
+                        # Recursively check for nested iframes, reusing the
+                        # same path list as a DFS stack
+                        current_path.append(frame_info.xpath.split('/')[-1])
+                        try:
+                            self._discover_all_iframes(current_path, depth + 1)
+                        finally:
+                            current_path.pop()
                         
                     except Exception as e:
                         frame_info.is_accessible = False
                         frame_info.error_message = str(e)
-                        self.logger.warning(f"⚠️  Cannot access iframe {i}: {str(e)}")
+                        self.logger.warning("⚠️  Cannot access iframe %d: %s", i, e)
                     
                     finally:
                         # Always switch back to parent
                         self.driver.switch_to.parent_frame()
+                        self._frame_depth = max(0, self._frame_depth - 1)
         
         except Exception as e:
-            self.logger.error(f"❌ Error discovering iframes at depth {depth}: {str(e)}")
+            self.logger.error("❌ Error discovering iframes at depth %d: %s", depth, e)
     
-    def _extract_iframe_info(self, frame, index: int, current_path: List[str], depth: int) -> IframeInfo:
-        """Extract comprehensive information about an iframe."""
+    def _extract_iframe_info(self, record: Dict[str, Any], index: int, current_path: List[str], depth: int) -> IframeInfo:
+        """Build iframe information from a batched discovery record."""
         try:
-            # Get all available attributes
-            frame_id = frame.get_attribute("id") or ""
-            frame_name = frame.get_attribute("name") or ""
-            frame_src = frame.get_attribute("src") or ""
-            frame_title = frame.get_attribute("title") or ""
-            frame_class = frame.get_attribute("class") or ""
-            
-            # Generate XPath
-            xpath = self._generate_element_xpath(frame)
+            frame_id = record.get("id") or ""
+            frame_name = record.get("name") or ""
+            frame_src = record.get("src") or ""
+            frame_title = record.get("title") or ""
+            frame_class = record.get("className") or ""
+            xpath = record.get("xpath") or "//iframe"
             
             # Create hierarchy path
-            hierarchy_path = current_path + [self._get_frame_identifier(frame, index)]
-            
-            # Check if frame is accessible (basic check)
-            is_accessible = True
-            try:
-                # Try to get the frame's tag name as a basic accessibility test
-                frame.tag_name
-            except:
-                is_accessible = False
+            hierarchy_path = (
+                *current_path, frame_identifier(frame_id, frame_name, frame_src, index)
+            )
             
             return IframeInfo(
                 index=index,
@@ -221,11 +409,13 @@ class ComprehensiveIframeScanner:
                 class_name=frame_class,
                 xpath=xpath,
                 hierarchy_path=hierarchy_path,
-                is_accessible=is_accessible
+                # Assume accessible; cross-origin or stale frames are caught
+                # when switch_to.frame raises during discovery
+                is_accessible=True
             )
             
         except Exception as e:
-            self.logger.warning(f"⚠️  Error extracting iframe info: {str(e)}")
+            self.logger.warning("⚠️  Error extracting iframe info: %s", e)
             return IframeInfo(
                 index=index,
                 id="",
@@ -234,66 +424,18 @@ class ComprehensiveIframeScanner:
                 title="",
                 class_name="",
                 xpath="",
-                hierarchy_path=current_path + [f"iframe_{index}"],
+                hierarchy_path=(*current_path, f"iframe_{index}"),
                 is_accessible=False,
                 error_message=str(e)
             )
     
-    def _get_frame_identifier(self, frame, index: int) -> str:
-        """Get a human-readable identifier for the frame."""
-        frame_id = frame.get_attribute("id")
-        if frame_id:
-            return f"id='{frame_id}'"
-        
-        frame_name = frame.get_attribute("name")
-        if frame_name:
-            return f"name='{frame_name}'"
-        
-        frame_src = frame.get_attribute("src")
-        if frame_src:
-            src_name = frame_src.split('/')[-1][:20]
-            return f"src='{src_name}'"
-        
-        return f"iframe_{index}"
-    
-    def _generate_element_xpath(self, element) -> str:
-        """Generate XPath for an element."""
-        try:
-            xpath = self.driver.execute_script("""
-                function getElementXPath(element) {
-                    if (element.id !== '') {
-                        return "//*[@id='" + element.id + "']";
-                    }
-                    if (element === document.body) {
-                        return '/html/body';
-                    }
-                    var ix = 0;
-                    var siblings = element.parentNode.childNodes;
-                    for (var i = 0; i < siblings.length; i++) {
-                        var sibling = siblings[i];
-                        if (sibling === element) {
-                            return getElementXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                        }
-                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                            ix++;
-                        }
-                    }
-                }
-                return getElementXPath(arguments[0]);
-            """, element)
-            return xpath or "//iframe"
-        except:
-            return "//iframe"
-    
     def _get_content_preview(self) -> str:
         """Get a preview of the current frame's content."""
         try:
-            # Get page title
-            title = self.driver.title
-            
-            # Get some text content
-            body = self.driver.find_element(By.TAG_NAME, "body")
-            text_content = body.text[:200]  # First 200 characters
+            # Get page title and the first 200 characters of text, sliced in-page
+            title, text_content = self._eval_js(
+                "return [document.title || '', document.body ? document.body.innerText.slice(0, 200) : ''];"
+            )
             
             # Clean up the text
             lines = [line.strip() for line in text_content.split('\n') if line.strip()]
@@ -315,93 +457,115 @@ class ComprehensiveIframeScanner:
             'locations': []
         }
         
+        # Build the strategies once and evaluate them as a single XPath union;
+        # the last (nested text) strategy runs as an in-page text-node walk
+        union_xpath = ' | '.join(build_search_strategies(search_text)[:-1])
+        
         # Search in main page first
         self._return_to_main_context()
         self.logger.info("🔍 Searching in main page...")
-        main_results = self._search_in_current_context(search_text, ["main_page"])
+        main_results = self._search_in_current_context(search_text, union_xpath, ["main_page"])
         
         if main_results:
             self.search_results['locations'].extend(main_results)
             self.search_results['total_locations_found'] += len(main_results)
         
         # Search in each accessible iframe
-        for iframe_info in self.discovered_iframes:
-            if iframe_info.is_accessible:
-                try:
-                    self.logger.info(f"🔍 Searching in iframe: {' → '.join(iframe_info.hierarchy_path)}")
-                    
-                    # Navigate to the iframe
-                    self._navigate_to_iframe(iframe_info)
-                    
-                    # Search in this iframe
-                    iframe_results = self._search_in_current_context(search_text, iframe_info.hierarchy_path)
-                    
-                    if iframe_results:
-                        iframe_info.text_found = iframe_results
-                        self.search_results['locations'].extend(iframe_results)
-                        self.search_results['total_locations_found'] += len(iframe_results)
-                    
-                except Exception as e:
-                    self.logger.warning(f"⚠️  Error searching in iframe {iframe_info.hierarchy_path}: {str(e)}")
-                
-                finally:
-                    self._return_to_main_context()
+        accessible = [f for f in self.discovered_iframes if f.is_accessible]
+        if self.workers > 1 and len(accessible) > 1:
+            all_results = self._search_iframes_parallel(accessible, search_text, union_xpath)
+        else:
+            all_results = [self._search_iframe(f, search_text, union_xpath) for f in accessible]
+        
+        # Merge in discovery order so reports do not depend on worker timing
+        for iframe_info, iframe_results in zip(accessible, all_results):
+            if iframe_results:
+                iframe_info.text_found = iframe_results
+                self.search_results['locations'].extend(iframe_results)
+                self.search_results['total_locations_found'] += len(iframe_results)
     
-    def _search_in_current_context(self, search_text: str, location_path: List[str]) -> List[Dict]:
-        """Search for text in the current context using multiple strategies."""
-        found_elements = []
-        
-        # Multiple search strategies - no need for user to specify!
-        search_strategies = [
-            # Exact text match
-            f"//*[text()='{search_text}']",
-            # Contains text
-            f"//*[contains(text(), '{search_text}')]",
-            # Partial matches for each word
-            f"//*[contains(text(), '{search_text.split()[0] if search_text.split() else search_text}')]",
-            # Case insensitive
-            f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_text.lower()}')]",
-            # In attributes
-            f"//*[@title[contains(., '{search_text}')] or @alt[contains(., '{search_text}')] or @placeholder[contains(., '{search_text}')]]",
-            # In any text content (including nested)
-            f"//*[contains(., '{search_text}')]"
-        ]
+    def _search_iframe(self, iframe_info: IframeInfo, search_text: str, union_xpath: str) -> List[Dict]:
+        """Search for text inside a single iframe using this scanner's driver."""
+        try:
+            self.logger.info("🔍 Searching in iframe: %s", ' → '.join(iframe_info.hierarchy_path))
+            
+            # Navigate to the iframe
+            self._navigate_to_iframe(iframe_info)
+            
+            # Search in this iframe
+            return self._search_in_current_context(search_text, union_xpath, iframe_info.hierarchy_path)
+            
+        except Exception as e:
+            self.logger.warning("⚠️  Error searching in iframe %s: %s", iframe_info.hierarchy_path, e)
+            return []
         
-        for i, xpath in enumerate(search_strategies):
-            try:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-                
-                for element in elements:
-                    try:
-                        # Get element details
-                        tag_name = element.tag_name
-                        element_text = element.text[:100]  # First 100 chars
-                        element_xpath = self._generate_element_xpath(element)
-                        
-                        # Check if this element is already found
-                        already_found = any(
-                            found['element_xpath'] == element_xpath 
-                            for found in found_elements
-                        )
-                        
-                        if not already_found:
-                            found_elements.append({
-                                'location_path': location_path,
-                                'strategy_used': f"Strategy {i+1}",
-                                'xpath_used': xpath,
-                                'element_xpath': element_xpath,
-                                'tag_name': tag_name,
-                                'element_text': element_text,
-                                'found_text': search_text
-                            })
-                    
-                    except Exception as e:
-                        continue  # Skip problematic elements
-                        
-            except Exception as e:
-                continue  # Skip problematic strategies
+        finally:
+            self._return_to_main_context()
+    
+    def _search_iframes_parallel(self, iframes: List[IframeInfo], search_text: str, union_xpath: str) -> List[List[Dict]]:
+        """Search iframes across a pool of worker browsers, one Chrome per worker."""
+        worker_count = min(self.workers, len(iframes))
+        self.logger.info("🧵 Searching %d iframe(s) with %d worker browser(s)", len(iframes), worker_count)
+        
+        # Round-robin partition, keeping each iframe's position for the merge
+        partitions = [list(range(i, len(iframes), worker_count)) for i in range(worker_count)]
+        all_results = [[] for _ in iframes]
+        
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(self._search_partition, [iframes[i] for i in positions], search_text, union_xpath)
+                for positions in partitions
+            ]
+            for positions, future in zip(partitions, futures):
+                partition_results = future.result()
+                if partition_results is None:
+                    # Worker browser could not be used, fall back to this driver
+                    partition_results = [self._search_iframe(iframes[i], search_text, union_xpath) for i in positions]
+                for i, iframe_results in zip(positions, partition_results):
+                    all_results[i] = iframe_results
+        
+        return all_results
+    
+    def _search_partition(self, iframes: List[IframeInfo], search_text: str, union_xpath: str):
+        """Search a partition of iframes in a dedicated worker browser.
+        
+        Returns None when the worker browser cannot be started or loaded.
+        """
+        worker = None
+        try:
+            worker = ComprehensiveIframeScanner(headless=self.headless, timeout=self.timeout)
+            worker._load_page(*self._source)
+        except Exception as e:
+            self.logger.warning("⚠️  Worker browser unavailable: %s", e)
+            if worker:
+                worker.close()
+            return None
+        
+        try:
+            return [worker._search_iframe(f, search_text, union_xpath) for f in iframes]
+        finally:
+            worker.close()
+    
+    def _search_in_current_context(self, search_text: str, union_xpath: str, location_path: List[str]) -> List[Dict]:
+        """Search for text in the current context with the combined strategy XPath."""
+        try:
+            # XPath evaluation, XPath generation and de-duplication all run in-page
+            matches = self._eval_js(_SEARCH_JS, union_xpath, search_text) or []
+        except Exception:
+            return []  # Skip contexts where the query cannot be evaluated
         
-        return found_elements
+        return [
+            {
+                'location_path': location_path,
+                'strategy_used': "Combined strategies",
+                'xpath_used': union_xpath,
+                'element_xpath': match.get('xpath') or "//iframe",
+                'tag_name': match.get('tagName', ''),
+                'element_text': match.get('text', ''),
+                'found_text': search_text
+            }
+            for match in matches
+        ]
     
     def _navigate_to_iframe(self, iframe_info: IframeInfo):
         """Navigate to a specific iframe."""
@@ -418,6 +582,7 @@ class ComprehensiveIframeScanner:
                 iframe = self.driver.find_element(By.XPATH, iframe_info.xpath)
             
             self.driver.switch_to.frame(iframe)
+            self._frame_depth = 1
             
         except Exception as e:
             raise Exception(f"Cannot navigate to iframe: {str(e)}")
@@ -426,9 +591,36 @@ class ComprehensiveIframeScanner:
         """Return to main page context."""
         try:
             self.driver.switch_to.default_content()
+            self._frame_depth = 0
         except:
             pass
     
+    def _eval_js(self, script: str, *args, return_by_value: bool = True):
+        """Run an in-page script body and return its result.
+        
+        In the top-level document this goes through CDP Runtime.evaluate, which
+        skips the WebDriver execute endpoint. CDP always evaluates in the top
+        frame, so inside iframes (or without CDP) execute_script is used.
+        Arguments must be JSON-serializable and are exposed as `arguments`.
+        """
+        if self._frame_depth == 0 and self._cdp_available:
+            expression = f"(function() {{{script}\n}}).apply(null, {json.dumps(args)})"
+            try:
+                response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": expression,
+                    "returnByValue": return_by_value
+                })
+            except (WebDriverException, AttributeError):
+                self._cdp_available = False
+            else:
+                if "exceptionDetails" in response:
+                    details = response["exceptionDetails"]
+                    message = details.get("exception", {}).get("description") or details.get("text", "")
+                    raise JavascriptException(message)
+                return response.get("result", {}).get("value")
+        
+        return self.driver.execute_script(script, *args)
+    
     def _generate_report(self, search_text: str = None) -> Dict[str, Any]:
         """Generate comprehensive report of findings."""
         report = {
@@ -460,7 +652,8 @@ class ComprehensiveIframeScanner:
         
         return report
     
-    def print_report(self, report: Dict[str, Any]):
+    @staticmethod
+    def print_report(report: Dict[str, Any]):
         """Print a formatted report to console."""
         print("\n" + "="*80)
         print("🔍 COMPREHENSIVE IFRAME SCAN REPORT")
@@ -531,7 +724,7 @@ class ComprehensiveIframeScanner:
                 self.driver.quit()
                 self.logger.info("✅ WebDriver closed successfully")
         except Exception as e:
-            self.logger.error(f"❌ Error closing WebDriver: {str(e)}")
+            self.logger.error("❌ Error closing WebDriver: %s", e)
 
 def main():
     """Example usage."""
@@ -3,54 +3,186 @@
 DOM-focused scanner - Paste your HTML/DOM and search for text.
 """
 
-from comprehensive_iframe_scanner import ComprehensiveIframeScanner
-from bs4 import BeautifulSoup
-
-def _compute_xpath(el):
-    parts = []
-    while el is not None and getattr(el, 'name', None) is not None:
-        tag = el.name
-        parent = el.parent
-        if parent is None or getattr(parent, 'find_all', None) is None:
-            parts.append(f"/{tag}")
-            break
-        same_tag_siblings = [sib for sib in parent.find_all(tag, recursive=False)]
-        if len(same_tag_siblings) == 1:
-            parts.append(f"/{tag}")
-        else:
-            index = 1
-            for sib in same_tag_siblings:
-                if sib is el:
-                    break
-                index += 1
-            parts.append(f"/{tag}[{index}]")
-        el = parent
-    return ''.join(reversed(parts)) or '/'
+import re
+import sys
+from typing import List, Dict, Any, Tuple
+from lxml import etree, html as lxml_html
+from scan_common import STRATEGY_TEMPLATES, frame_identifier, strategy_variables
+
+MAX_FRAME_DEPTH = 10
+
+# The shared search strategies, compiled once with XPath variables so every
+# document and search text reuses the same parsed expressions
+_COMPILED_STRATEGIES = [etree.XPath(tpl, smart_strings=False) for tpl in STRATEGY_TEMPLATES]
+
+def _parse_html(html_source: str):
+    """Parse an HTML document, or return None when it has no elements (e.g. only comments)."""
+    try:
+        try:
+            return lxml_html.document_fromstring(html_source)
+        except ValueError:
+            # lxml refuses str input carrying an <?xml ... encoding=...?>
+            # declaration; parse the UTF-8 bytes with the encoding pinned instead
+            parser = lxml_html.HTMLParser(encoding='utf-8')
+            return lxml_html.document_fromstring(html_source.encode('utf-8'), parser=parser)
+    except etree.ParserError:
+        return None
+
+def _document_text(root) -> str:
+    """Document text with text nodes separated by spaces, so text across elements still matches."""
+    return ' '.join(root.itertext())
 
 def find_iframe_xpaths_in_dom(html_source: str, search_text: str):
+    root = _parse_html(html_source)
+    return [] if root is None else _iframe_xpaths(root, search_text)
+
+def _iframe_xpaths(root, search_text: str) -> List[str]:
+    """XPaths of the frames in a parsed document whose attributes or srcdoc text hold search_text."""
     matches = []
-    soup = BeautifulSoup(html_source, 'html.parser')
-    iframes = soup.find_all(['iframe', 'frame'])
-    search_lower = search_text.lower()
-    for iframe in iframes:
-        attrs_text = ' '.join([str(v) for v in iframe.attrs.values()])
-        hit = False
-        if search_lower in attrs_text.lower():
-            hit = True
+    tree = root.getroottree()
+    # Compiled once and reused for every frame; matches case-insensitively
+    # without building a lowered copy of each attribute value
+    search = re.compile(re.escape(search_text), re.IGNORECASE).search
+    for iframe in root.iter('iframe', 'frame'):
+        # Short-circuits on the first matching attribute, no joined copy
+        hit = any(search(value) for value in iframe.attrib.values())
         srcdoc = iframe.get('srcdoc')
+        # A raw srcdoc hit in the attribute check above settles it; otherwise the
+        # text may still match once tags are removed and entities decoded
         if not hit and srcdoc:
-            try:
-                inner = BeautifulSoup(srcdoc, 'html.parser')
-                if search_lower in inner.get_text(separator=' ').lower():
-                    hit = True
-            except Exception:
-                pass
+            inner = _parse_html(srcdoc)
+            # Joined text catches words split across elements, text_content
+            # catches a single word split by inline tags
+            if inner is not None and (search(_document_text(inner)) or search(inner.text_content())):
+                hit = True
         if hit:
-            matches.append(_compute_xpath(iframe))
+            matches.append(tree.getpath(iframe))
     return matches
 
-def scan_dom():
-    """Simple DOM scanning interface."""
+def _text_node_parents(root, needle: str):
+    """Elements under <body> owning a text node that contains needle (already lowered).
+
+    Mirrors the browser's text-node walk for the nested text strategy, which
+    reports the element holding the text rather than every ancestor that
+    //*[contains(., ...)] would match.
+    """
+    body = root.find('body')
+    if body is None:
+        return
+    for el in body.iter():
+        if not isinstance(el.tag, str):
+            continue  # Comments and processing instructions hold no text nodes
+        if el.text and needle in el.text.lower():
+            yield el
+            continue
+        # Text that follows a child element belongs to this element too
+        if any(child.tail and needle in child.tail.lower() for child in el):
+            yield el
+
+def _search_document(root, variables: Dict[str, str], search_text: str, location_path: List[str]) -> List[Dict]:
+    """Run the compiled search strategies against one parsed document."""
+    tree = root.getroottree()
+    found_elements = []
+    seen_xpaths = set()
+    
+    def add_matches(elements, strategy_used, xpath_used):
+        for el in elements:
+            element_xpath = tree.getpath(el)
+            if element_xpath in seen_xpaths:
+                continue
+            seen_xpaths.add(element_xpath)
+            found_elements.append({
+                'location_path': location_path,
+                'strategy_used': strategy_used,
+                'xpath_used': xpath_used,
+                'element_xpath': element_xpath,
+                'tag_name': el.tag,
+                'element_text': el.text_content().strip()[:100],
+                'found_text': search_text
+            })
+    
+    for i, strategy in enumerate(_COMPILED_STRATEGIES[:-1]):
+        add_matches(strategy(root, **variables), f"Strategy {i+1}", strategy.path)
+    # The nested text strategy runs as a text-node walk, as in the browser
+    nested = _COMPILED_STRATEGIES[-1]
+    add_matches(_text_node_parents(root, variables['lower']), f"Strategy {len(_COMPILED_STRATEGIES)}", nested.path)
+    return found_elements
+
+def _scan_document(root, variables: Dict[str, str], search_text: str, current_path: List[str],
+                   iframe_details: List[Dict], locations: List[Dict], depth: int = 0):
+    """Collect iframe details and text matches for a document and its srcdoc frames."""
+    tree = root.getroottree()
+    for index, frame in enumerate(root.iter('iframe', 'frame')):
+        hierarchy_path = current_path + [frame_identifier(frame.get('id'), frame.get('name'), frame.get('src'), index)]
+        srcdoc = frame.get('srcdoc')
+        detail = {
+            'hierarchy_path': ' → '.join(hierarchy_path),
+            'id': frame.get('id', ''),
+            'name': frame.get('name', ''),
+            'src': frame.get('src', ''),
+            'title': frame.get('title', ''),
+            'class': frame.get('class', ''),
+            'xpath': tree.getpath(frame),
+            'is_accessible': srcdoc is not None,
+            'error_message': '' if srcdoc is not None else 'No inline srcdoc content (external src is not fetched)',
+            'content_preview': '',
+            'text_found_count': 0
+        }
+        iframe_details.append(detail)
+        if srcdoc is None or not srcdoc.strip() or depth >= MAX_FRAME_DEPTH:
+            continue
+        inner = _parse_html(srcdoc)
+        if inner is None:
+            continue
+        lines = [line.strip() for line in inner.text_content()[:200].split('\n') if line.strip()]
+        detail['content_preview'] = f"Content: {' | '.join(lines[:3])}"
+        inner_matches = _search_document(inner, variables, search_text, hierarchy_path)
+        detail['text_found_count'] = len(inner_matches)
+        locations.extend(inner_matches)
+        _scan_document(inner, variables, search_text, hierarchy_path, iframe_details, locations, depth + 1)
+
+def scan_dom_source(html_source: str, search_text: str) -> Dict[str, Any]:
+    """Scan pasted HTML for iframes and text without starting a browser.
+
+    Returns a report with the same layout as ComprehensiveIframeScanner.scan_page.
+    Only inline srcdoc content is searched inside frames.
+    """
+    return _scan_root(_parse_html(html_source), search_text)
+
+def scan_dom_with_xpaths(html_source: str, search_text: str) -> Tuple[List[str], Dict[str, Any]]:
+    """Return find_iframe_xpaths_in_dom and scan_dom_source results from a single parse."""
+    root = _parse_html(html_source)
+    xpaths = [] if root is None else _iframe_xpaths(root, search_text)
+    return xpaths, _scan_root(root, search_text)
+
+def _scan_root(root, search_text: str) -> Dict[str, Any]:
+    """Build the scan_dom_source report for a parsed document (None when empty)."""
+    variables = strategy_variables(search_text)
+    iframe_details = []
+    locations = []
+    if root is not None:
+        locations = _search_document(root, variables, search_text, ["main_page"])
+        _scan_document(root, variables, search_text, ["main_page"], iframe_details, locations)
+    accessible = sum(1 for detail in iframe_details if detail['is_accessible'])
+    return {
+        'scan_summary': {
+            'total_iframes_found': len(iframe_details),
+            'accessible_iframes': accessible,
+            'inaccessible_iframes': len(iframe_details) - accessible,
+        },
+        'iframe_details': iframe_details,
+        'search_results': {
+            'search_text': search_text,
+            'total_locations_found': len(locations),
+            'locations': locations
+        }
+    }
+
+def scan_dom(dom_only: bool = False):
+    """Simple DOM scanning interface.
+
+    With dom_only the HTML is parsed with lxml and no browser is started.
+    """
     print("🔍 DOM/HTML IFRAME SCANNER")
     print("="*40)
     print("✨ Paste your HTML/DOM source")
@@ -96,15 +228,23 @@ def scan_dom():
     print(f"   Searching for: '{search_text}'")
     print("-"*40)
     
-    # Create scanner
-    scanner = ComprehensiveIframeScanner(headless=False, timeout=15)
+    # Imported here so the DOM-only helpers above load without Selenium,
+    # e.g. in web_app's DOM parse worker processes
+    from comprehensive_iframe_scanner import ComprehensiveIframeScanner
+    
+    scanner = None
     
     try:
-        # Run scan on DOM
-        report = scanner.scan_page(html_source=html_source, search_text=search_text)
+        if dom_only:
+            # Parse the DOM in-process, no browser needed
+            report = scan_dom_source(html_source, search_text)
+        else:
+            # Create scanner and run scan on DOM
+            scanner = ComprehensiveIframeScanner(headless=False, timeout=15)
+            report = scanner.scan_page(html_source=html_source, search_text=search_text)
         
         # Print results
-        scanner.print_report(report)
+        ComprehensiveIframeScanner.print_report(report)
         
         # DOM-only fallback to extract iframe XPaths from provided HTML (no browser access)
         print("\n🧭 DOM-only iframe XPath matches (from provided HTML, attributes/srcdoc only):")
@@ -146,7 +286,8 @@ def scan_dom():
         print(f"❌ Error during DOM scan: {e}")
     
     finally:
-        scanner.close()
+        if scanner:
+            scanner.close()
 
 if __name__ == "__main__":
-    scan_dom()
+    scan_dom(dom_only='--dom-only' in sys.argv[1:])
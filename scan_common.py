@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Search strategies and frame naming shared by the browser scanner and the
+DOM-only scanner, so both paths match and label frames the same way.
+
+Kept free of Selenium imports; the DOM-only path loads it without a browser.
+"""
+
+from functools import lru_cache
+from string import Template
+from typing import Dict, Tuple
+
+# Number of distinct search texts whose XPath strategies are kept around
+STRATEGY_CACHE_SIZE = 32
+
+# Multiple search strategies - no need for user to specify!
+# $text, $first_word and $lower are XPath variables; the DOM-only scanner
+# compiles these templates as-is and the browser scanner inlines literals
+STRATEGY_TEMPLATES = (
+    # Exact text match
+    "//*[text()=$text]",
+    # Contains text
+    "//*[contains(text(), $text)]",
+    # Partial matches for each word
+    "//*[contains(text(), $first_word)]",
+    # Case insensitive
+    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), $lower)]",
+    # In attributes
+    "//*[@title[contains(., $text)] or @alt[contains(., $text)] or @placeholder[contains(., $text)]]",
+    # In any text content (including nested)
+    "//*[contains(., $text)]",
+)
+
+def strategy_variables(search_text: str) -> Dict[str, str]:
+    """Values for the variables used in STRATEGY_TEMPLATES."""
+    words = search_text.split()
+    return {
+        'text': search_text,
+        'first_word': words[0] if words else search_text,
+        'lower': search_text.lower(),
+    }
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string as an XPath 1.0 literal, using concat() if it has both quote types."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+@lru_cache(maxsize=STRATEGY_CACHE_SIZE)
+def build_search_strategies(search_text: str) -> Tuple[str, ...]:
+    """Build the XPath search strategies used to locate a text, cached per search text."""
+    literals = {name: _xpath_literal(value) for name, value in strategy_variables(search_text).items()}
+    return tuple(Template(template).substitute(literals) for template in STRATEGY_TEMPLATES)
+
+def frame_identifier(frame_id: str, frame_name: str, frame_src: str, index: int) -> str:
+    """Get a human-readable identifier for the frame."""
+    if frame_id:
+        return f"id='{frame_id}'"
+
+    if frame_name:
+        return f"name='{frame_name}'"
+
+    if frame_src:
+        src_name = frame_src.split('/')[-1][:20]
+        return f"src='{src_name}'"
+
+    return f"iframe_{index}"
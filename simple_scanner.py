@@ -7,22 +7,29 @@ Just provide URL and text to search - it does everything automatically:
 2. Searches everywhere automatically
 """
 
+import itertools
+import sys
+
 from comprehensive_iframe_scanner import ComprehensiveIframeScanner
 
+BANNER = "\n".join([
+    "🔍 COMPREHENSIVE IFRAME & TEXT SCANNER",
+    "="*50,
+    "✨ No locator strategies needed!",
+    "✨ Automatically finds all iframes!",
+    "✨ Searches everywhere automatically!",
+    "✨ Supports both URL and DOM/HTML input!",
+    "="*50,
+    "",
+    "📝 Choose input method:",
+    "1. Enter URL to scan",
+    "2. Provide HTML/DOM source",
+    ""
+])
+
 def simple_scan():
     """Simple interface for comprehensive scanning."""
-    print("🔍 COMPREHENSIVE IFRAME & TEXT SCANNER")
-    print("="*50)
-    print("✨ No locator strategies needed!")
-    print("✨ Automatically finds all iframes!")
-    print("✨ Searches everywhere automatically!")
-    print("✨ Supports both URL and DOM/HTML input!")
-    print("="*50)
-    
-    # Choose input method
-    print("\n📝 Choose input method:")
-    print("1. Enter URL to scan")
-    print("2. Provide HTML/DOM source")
+    sys.stdout.write(BANNER)
     
     choice = input("Enter choice (1 or 2): ").strip()
     
@@ -43,25 +50,14 @@ def simple_scan():
     elif choice == "2":
         # HTML/DOM input
         print("\n📄 Enter HTML/DOM source:")
-        print("   (Paste your HTML content, then press Enter twice to finish)")
-        
-        lines = []
-        empty_lines = 0
+        print("   (Paste your HTML content, then enter a line with only '.' to finish;")
+        print("    Ctrl+Z and Enter on Windows, or Ctrl+D on Mac/Linux, also works)")
         
-        while True:
-            try:
-                line = input()
-                if not line.strip():
-                    empty_lines += 1
-                    if empty_lines >= 2:  # Two empty lines to finish
-                        break
-                else:
-                    empty_lines = 0
-                lines.append(line)
-            except EOFError:
-                break
-        
-        html_source = '\n'.join(lines).strip()
+        # Stop at the sentinel line so later prompts can keep reading stdin;
+        # EOF ends the paste as well
+        html_source = ''.join(
+            itertools.takewhile(lambda line: line.rstrip('\r\n') != '.', sys.stdin)
+        ).strip()
         
         if not html_source:
             print("❌ HTML source is required!")
@@ -79,13 +75,14 @@ def simple_scan():
         print("❌ Search text is required!")
         return
     
-    print(f"\n🚀 Starting comprehensive scan...")
+    status = ["\n🚀 Starting comprehensive scan..."]
     if url:
-        print(f"   URL: {url}")
+        status.append(f"   URL: {url}")
     else:
-        print(f"   HTML Source: {len(html_source)} characters")
-    print(f"   Searching for: '{search_text}'")
-    print("-"*50)
+        status.append(f"   HTML Source: {len(html_source)} characters")
+    status.append(f"   Searching for: '{search_text}'")
+    status.append("-"*50)
+    sys.stdout.write('\n'.join(status) + '\n')
     
     # Create scanner
     scanner = ComprehensiveIframeScanner(headless=False, timeout=20)  # Visible browser
@@ -104,14 +101,13 @@ def simple_scan():
         total_iframes = report['scan_summary']['total_iframes_found']
         total_matches = report['search_results']['total_locations_found'] if report['search_results'] else 0
         
-        print(f"\n🎉 SCAN COMPLETE!")
-        print(f"   Found {total_iframes} iframe(s)")
-        print(f"   Found '{search_text}' in {total_matches} location(s)")
-        
-        if total_matches > 0:
-            print(f"✅ SUCCESS: Text found!")
-        else:
-            print(f"❌ Text not found anywhere")
+        summary = [
+            "\n🎉 SCAN COMPLETE!",
+            f"   Found {total_iframes} iframe(s)",
+            f"   Found '{search_text}' in {total_matches} location(s)",
+            "✅ SUCCESS: Text found!" if total_matches > 0 else "❌ Text not found anywhere"
+        ]
+        sys.stdout.write('\n'.join(summary) + '\n')
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -3,21 +3,40 @@
 Startup script for the Comprehensive Iframe Scanner Web Application
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
+HEADER = "🚀 Comprehensive Iframe Scanner - Web Application\n" + "=" * 60 + "\n"
+
+STARTUP_BANNER = """
+🌐 Starting web application...
+📱 The application will be available at: http://localhost:5000
+🔧 Features:
+   • Modern responsive web interface
+   • Real-time progress updates
+   • Support for URL and HTML/DOM input
+   • Comprehensive iframe discovery
+   • Advanced text search with multiple strategies
+   • Live logging and detailed results
+   • Export functionality
+""" + "=" * 60 + """
+
+⏳ Starting server... (Press Ctrl+C to stop)
+"""
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import flask
-        import flask_socketio
-        import selenium
-        print("✅ All dependencies are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        return False
+    # Only locate the packages: web_app has to run eventlet.monkey_patch()
+    # before any of them (or the stdlib modules they pull in) is imported
+    for name in ("eventlet", "flask", "flask_socketio", "selenium",
+                 "lxml", "fastjsonschema", "cachetools", "orjson"):
+        if importlib.util.find_spec(name) is None:
+            print(f"❌ Missing dependency: {name}")
+            return False
+    print("✅ All dependencies are installed")
+    return True
 
 def install_dependencies():
     """Install required dependencies."""
@@ -32,8 +51,7 @@ def install_dependencies():
 
 def main():
     """Main startup function."""
-    print("🚀 Comprehensive Iframe Scanner - Web Application")
-    print("=" * 60)
+    sys.stdout.write(HEADER)
     
     # Check if we're in the right directory
     if not os.path.exists("comprehensive_iframe_scanner.py"):
@@ -47,23 +65,15 @@ def main():
         if not install_dependencies():
             return
     
-    print("\n🌐 Starting web application...")
-    print("📱 The application will be available at: http://localhost:5000")
-    print("🔧 Features:")
-    print("   • Modern responsive web interface")
-    print("   • Real-time progress updates")
-    print("   • Support for URL and HTML/DOM input")
-    print("   • Comprehensive iframe discovery")
-    print("   • Advanced text search with multiple strategies")
-    print("   • Live logging and detailed results")
-    print("   • Export functionality")
-    print("=" * 60)
-    print("\n⏳ Starting server... (Press Ctrl+C to stop)")
+    sys.stdout.write(STARTUP_BANNER)
+    sys.stdout.flush()
     
     try:
         # Import and run the web application
-        from web_app import app, socketio
-        socketio.run(app, debug=False, host='0.0.0.0', port=5000)
+        from web_app import app
+        import eventlet
+        import eventlet.wsgi
+        eventlet.wsgi.server(eventlet.listen(('0.0.0.0', 5000)), app)
     except KeyboardInterrupt:
         print("\n👋 Web application stopped by user")
     except Exception as e:
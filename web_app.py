@@ -6,17 +6,31 @@ A Flask-based web application with real-time updates, modern UI,
 and comprehensive iframe scanning capabilities.
 """
 
+# eventlet must patch the standard library before anything else imports it
+import eventlet
+eventlet.monkey_patch()
+
+import atexit
 import os
+import sys
 import json
+import queue
+import secrets
+import hashlib
+import multiprocessing
 import threading
 import time
-import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, session
+import fastjsonschema
+import orjson
+from flask import Flask, Response, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit, join_room, leave_room
+from cachetools import TTLCache
 import logging
 from comprehensive_iframe_scanner import ComprehensiveIframeScanner
-from dom_scanner import find_iframe_xpaths_in_dom
+from dom_scanner import find_iframe_xpaths_in_dom, scan_dom_with_xpaths
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,28 +40,318 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'iframe_scanner_frontend_2025'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
 
-# Global storage for scan sessions
-scan_sessions = {}
+# Global storage for scan sessions; sessions expire an hour after creation.
+# TTLCache is not thread-safe, so every access goes through _sess_lock.
+SESSION_TTL = 3600
+SESSION_EVICT_INTERVAL = 60
+scan_sessions = TTLCache(maxsize=1024, ttl=SESSION_TTL)
 active_scanners = {}
+_sess_lock = threading.RLock()
+
+class WebDriverPool:
+    """Bounded pool of warm headless Chrome drivers shared across scans.
+    
+    Drivers are started lazily, handed to one scan at a time, reset between
+    uses and retired after max_uses scans to bound browser memory growth.
+    """
+    
+    def __init__(self, size, max_uses):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._uses = {}
+    
+    def acquire(self):
+        """Return an idle driver, starting a new one while below the pool size."""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            
+            if can_create:
+                try:
+                    driver = ComprehensiveIframeScanner.build_driver(headless=True)
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+                self._uses[driver] = 0
+                return driver
+            
+            # Pool is at capacity; wait for a release (or a retirement to free a slot)
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+    
+    def release(self, driver):
+        """Reset a driver and return it to the pool, or retire it."""
+        uses = self._uses.get(driver, 0) + 1
+        if uses >= self.max_uses:
+            self._discard(driver)
+            return
+        
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"Discarding pooled WebDriver that failed to reset: {e}")
+            self._discard(driver)
+            return
+        
+        self._uses[driver] = uses
+        self._idle.put(driver)
+    
+    @staticmethod
+    def _reset(driver):
+        """Clear everything a scan could leave behind for the next user of the browser."""
+        driver.switch_to.default_content()
+        
+        # Origins of the page and all its frames, while they are still loaded
+        origins = set()
+        pending = [driver.execute_cdp_cmd('Page.getFrameTree', {})['frameTree']]
+        while pending:
+            node = pending.pop()
+            origin = node['frame'].get('securityOrigin')
+            if origin and origin != '://':
+                origins.add(origin)
+            pending.extend(node.get('childFrames', []))
+        
+        # delete_all_cookies only covers the current document's domain, so clear
+        # cookies and cache browser-wide, and per-origin storage for every frame
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        for origin in origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        
+        # sessionStorage lives with the tab, so continue in a fresh one and
+        # close the old tab along with any windows the page opened
+        stale = driver.window_handles
+        driver.switch_to.new_window('tab')
+        fresh = driver.current_window_handle
+        for handle in stale:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh)
+        driver.get('about:blank')
+    
+    def close_all(self):
+        """Quit every driver the pool has started, idle or still checked out."""
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for driver in list(self._uses):
+            self._discard(driver)
+    
+    def _discard(self, driver):
+        self._uses.pop(driver, None)
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+# Scans run on a bounded executor. A WebDriver session is not thread-safe,
+# so each running scan holds one pooled driver and both are sized together.
+SCAN_WORKERS = int(os.getenv('SCAN_WORKERS', '4'))
+executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix='scan')
+driver_pool = WebDriverPool(
+    size=SCAN_WORKERS,
+    max_uses=int(os.getenv('DRIVER_MAX_USES', '50'))
+)
+# Pooled browsers outlive individual scans; quit them when the server stops
+# so no Chrome or chromedriver processes are left behind
+atexit.register(driver_pool.close_all)
+
+# DOM-only parsing is CPU-bound, so cache misses run in worker processes
+# rather than on the thread serving the request
+DOM_PARSE_TIMEOUT = 30
+DOM_PARSE_WORKERS = int(os.getenv('DOM_PARSE_WORKERS', str(os.cpu_count() or 1)))
+_dom_pool = None
+_dom_pool_lock = threading.Lock()
+
+def get_dom_pool():
+    """Return the shared DOM parsing process pool, starting it on first use."""
+    global _dom_pool
+    with _dom_pool_lock:
+        if _dom_pool is None:
+            # forkserver needs fd passing, which eventlet's green sockets lack,
+            # and forking a monkey-patched process is unsafe. Spawned workers
+            # are reused; unpickling the task imports dom_scanner, which only
+            # pulls in lxml and scan_common
+            _dom_pool = ProcessPoolExecutor(
+                max_workers=DOM_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            # Under eventlet the interpreter hangs on exit unless the pool
+            # is shut down explicitly
+            atexit.register(_dom_pool.shutdown)
+        return _dom_pool
+
+# DOM-only results (iframe XPath lists and scan_dom_with_xpaths reports) keyed
+# by (task, HTML digest, search text); digests keep large pasted documents out
+# of the cache keys
+DOM_RESULT_CACHE_SIZE = 512
+_dom_result_cache = OrderedDict()
+_dom_result_lock = threading.Lock()
+
+def cached_dom_call(task, html_source, search_text):
+    """Run a dom_scanner task in the parse pool, reusing its result for repeated requests.
+    
+    Cached results are shared between requests and must not be mutated.
+    """
+    digest = hashlib.blake2b(html_source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    key = (task.__name__, digest, search_text)
+    with _dom_result_lock:
+        result = _dom_result_cache.get(key)
+        if result is not None:
+            _dom_result_cache.move_to_end(key)
+            return result
+    
+    future = get_dom_pool().submit(task, html_source, search_text)
+    try:
+        result = future.result(timeout=DOM_PARSE_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+    with _dom_result_lock:
+        _dom_result_cache[key] = result
+        if len(_dom_result_cache) > DOM_RESULT_CACHE_SIZE:
+            _dom_result_cache.popitem(last=False)
+    return result
+
+def cached_dom_iframe_xpaths(html_source, search_text):
+    """Return find_iframe_xpaths_in_dom results, reusing them for repeated requests."""
+    return list(cached_dom_call(find_iframe_xpaths_in_dom, html_source, search_text))
+
+# Log/status coalescing: pending entries are flushed every interval, or
+# immediately once this many bytes of log text are buffered
+EMIT_FLUSH_INTERVAL = 0.05
+EMIT_FLUSH_BYTES = 64 * 1024
+
+# Active emitters by session ID
+session_emitters = {}
+
+class SessionEmitter:
+    """Coalesces a scan session's log lines and status updates into fewer frames.
+    
+    Log entries are sent together as one 'log_batch' event per flush, and only
+    the latest status update since the previous flush is sent.
+    """
+    
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self._lock = threading.Lock()
+        self._entries = deque()
+        self._pending_bytes = 0
+        self._status = None
+        self._closed = False
+        socketio.start_background_task(self._run)
+    
+    def push_log(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+            self._pending_bytes += len(entry['message'])
+            flush_now = self._pending_bytes >= EMIT_FLUSH_BYTES
+        if flush_now:
+            self.flush()
+    
+    def set_status(self, status):
+        with self._lock:
+            self._status = status
+    
+    def flush(self):
+        with self._lock:
+            entries = list(self._entries)
+            self._entries.clear()
+            self._pending_bytes = 0
+            status, self._status = self._status, None
+        
+        if entries:
+            socketio.emit('log_batch', {'entries': entries}, room=self.session_id)
+        if status:
+            socketio.emit('status_update', status, room=self.session_id)
+    
+    def close(self):
+        self._closed = True
+        self.flush()
+    
+    def _run(self):
+        while not self._closed:
+            socketio.sleep(EMIT_FLUSH_INTERVAL)
+            self.flush()
+
+# Client-facing level names, resolved once instead of lowering levelname per record
+_LVL = {
+    logging.DEBUG: 'debug',
+    logging.INFO: 'info',
+    logging.WARNING: 'warning',
+    logging.ERROR: 'error',
+    logging.CRITICAL: 'critical'
+}
 
 class WebSocketHandler(logging.Handler):
     """Custom logging handler for real-time web updates."""
     
-    def __init__(self, session_id):
+    def __init__(self, session_id, emitter):
         super().__init__()
         self.session_id = session_id
+        self.emitter = emitter
+        self._push = emitter.push_log
         self.setLevel(logging.INFO)
     
     def emit(self, record):
-        if record.levelno >= self.level:
-            log_entry = self.format(record)
-            socketio.emit('log_message', {
-                'message': log_entry,
-                'level': record.levelname.lower(),
-                'timestamp': datetime.now().strftime('%H:%M:%S')
-            }, room=self.session_id)
+        # Logger.callHandlers has already applied this handler's level
+        self._push({
+            'message': self.format(record),
+            'level': _LVL.get(record.levelno, 'info'),
+            'timestamp': time.strftime('%H:%M:%S')
+        })
+
+def orjson_response(payload):
+    """Build a JSON response serialized by orjson instead of Flask's stdlib encoder."""
+    return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+# Compiled once at import; a value must contain a non-whitespace character
+# to count as provided, matching the old strip()-then-check validation
+_NON_BLANK = {'type': 'string', 'pattern': r'\S'}
+validate_start_scan = fastjsonschema.compile({
+    'type': 'object',
+    'properties': {
+        'url': {'type': 'string'},
+        'html_source': {'type': 'string'},
+        'search_text': _NON_BLANK,
+        'headless': {'type': 'boolean'},
+        'mode': {'enum': ['auto', 'dom', 'browser']}
+    },
+    'required': ['search_text'],
+    'anyOf': [
+        {'properties': {'url': _NON_BLANK}, 'required': ['url']},
+        {'properties': {'html_source': _NON_BLANK}, 'required': ['html_source']}
+    ]
+})
+
+def start_scan_error(e):
+    """Turn a schema violation into the message start_scan has always returned."""
+    if e.rule == 'anyOf':
+        return 'Either URL or HTML source is required'
+    if e.rule == 'required' or e.name == 'data.search_text':
+        return 'Search text is required'
+    if e.name == 'data':
+        return 'Request body must be a JSON object'
+    return str(e)
 
 @app.route('/')
 def index():
@@ -58,44 +362,57 @@ def index():
 def start_scan():
     """Start a new comprehensive scan."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         # Validate input
+        try:
+            validate_start_scan(data)
+        except fastjsonschema.JsonSchemaException as e:
+            return jsonify({'error': start_scan_error(e)}), 400
+        
         url = data.get('url', '').strip()
         html_source = data.get('html_source', '').strip()
-        search_text = data.get('search_text', '').strip()
-        
-        if not url and not html_source:
-            return jsonify({'error': 'Either URL or HTML source is required'}), 400
-        
-        if not search_text:
-            return jsonify({'error': 'Search text is required'}), 400
+        search_text = data['search_text'].strip()
+        
+        # Pasted HTML needs no browser unless the caller asks for one, so
+        # answer it from the DOM instead of queueing a Selenium scan
+        if html_source and not url and data.get('mode', 'auto') in ('auto', 'dom'):
+            # One parse in the pool yields both the frame XPaths and the report
+            xpaths, report = cached_dom_call(scan_dom_with_xpaths, html_source, search_text)
+            return orjson_response({
+                'success': True,
+                'mode': 'dom',
+                'xpaths': xpaths,
+                'results': process_scan_results(report)
+            })
         
         # Generate unique session ID
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(8)
         
         # Initialize session data
-        scan_sessions[session_id] = {
+        session_data = {
             'id': session_id,
             'status': 'initializing',
             'progress': 0,
             'message': 'Preparing scan...',
             'phase': 'init',
-            'start_time': datetime.now(),
+            'start_time_ns': time.monotonic_ns(),
+            'end_time_ns': None,
+            'wall_start': time.time(),
             'url': url,
-            'html_source': html_source[:500] + '...' if len(html_source) > 500 else html_source,
+            'html_source': html_source[:500],  # preview for scan_info
             'search_text': search_text,
             'results': None,
             'error': None
         }
+        with _sess_lock:
+            scan_sessions[session_id] = session_data
+        ensure_evictor()
         
-        # Start scan in background thread
-        thread = threading.Thread(
-            target=run_scan_background,
-            args=(session_id, url, html_source, search_text, data.get('headless', True))
+        # Queue the scan; it starts once a worker (and its browser) is free
+        session_data['future'] = executor.submit(
+            run_scan_background, session_id, url, html_source, search_text, data.get('headless', True)
         )
-        thread.daemon = True
-        thread.start()
         
         return jsonify({
             'success': True,
@@ -103,6 +420,9 @@ def start_scan():
             'message': 'Scan started successfully'
         })
         
+    except FutureTimeoutError:
+        logger.error("DOM-only scan timed out after %ss", DOM_PARSE_TIMEOUT)
+        return jsonify({'error': f'DOM parsing timed out after {DOM_PARSE_TIMEOUT}s'}), 504
     except Exception as e:
         logger.error(f"Error starting scan: {str(e)}")
         return jsonify({'error': f'Failed to start scan: {str(e)}'}), 500
@@ -110,7 +430,8 @@ def start_scan():
 @app.route('/api/scan-status/<session_id>')
 def get_scan_status(session_id):
     """Get current status of a scan session."""
-    session_data = scan_sessions.get(session_id)
+    with _sess_lock:
+        session_data = scan_sessions.get(session_id)
     
     if not session_data:
         return jsonify({'error': 'Session not found'}), 404
@@ -121,14 +442,29 @@ def get_scan_status(session_id):
         'progress': session_data['progress'],
         'message': session_data['message'],
         'phase': session_data['phase'],
-        'start_time': session_data['start_time'].isoformat(),
+        'start_time': datetime.fromtimestamp(session_data['wall_start']).isoformat(),
+        'elapsed_ms': ((session_data['end_time_ns'] or time.monotonic_ns()) - session_data['start_time_ns']) // 1_000_000,
         'error': session_data['error']
     })
 
+def results_payload(session_id, session_data):
+    """Build the /api/scan-results body for a completed session."""
+    return {
+        'session_id': session_id,
+        'results': session_data['results'],
+        'scan_info': {
+            'url': session_data['url'],
+            'html_source_preview': session_data['html_source'],
+            'search_text': session_data['search_text'],
+            'start_time': datetime.fromtimestamp(session_data['wall_start']).isoformat()
+        }
+    }
+
 @app.route('/api/scan-results/<session_id>')
 def get_scan_results(session_id):
     """Get results of a completed scan."""
-    session_data = scan_sessions.get(session_id)
+    with _sess_lock:
+        session_data = scan_sessions.get(session_id)
     
     if not session_data:
         return jsonify({'error': 'Session not found'}), 404
@@ -136,29 +472,45 @@ def get_scan_results(session_id):
     if session_data['status'] != 'completed':
         return jsonify({'error': 'Scan not completed yet'}), 400
     
-    return jsonify({
-        'session_id': session_id,
-        'results': session_data['results'],
-        'scan_info': {
-            'url': session_data['url'],
-            'html_source_preview': session_data['html_source'],
-            'search_text': session_data['search_text'],
-            'start_time': session_data['start_time'].isoformat()
-        }
-    })
+    etag = session_data.get('etag')
+    if etag is None:
+        return orjson_response(results_payload(session_id, session_data))
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers={'ETag': f'"{etag}"'})
+    return Response(session_data['results_json'], mimetype='application/json', headers={'ETag': f'"{etag}"'})
+
+@app.route('/api/scan-results/<session_id>', methods=['DELETE'])
+def delete_scan_results(session_id):
+    """Discard a scan session and its results once the client is done with them."""
+    with _sess_lock:
+        session_data = scan_sessions.pop(session_id, None)
+    
+    if not session_data:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    return jsonify({'success': True, 'session_id': session_id})
 
 @app.route('/api/stop-scan/<session_id>', methods=['POST'])
 def stop_scan(session_id):
     """Stop an active scan."""
     try:
-        if session_id in active_scanners:
-            scanner = active_scanners[session_id]
+        with _sess_lock:
+            session_data = scan_sessions.get(session_id)
+            scanner = active_scanners.pop(session_id, None)
+        
+        future = session_data.get('future') if session_data else None
+        if future:
+            # Drops the scan if it is still queued; running scans stop via the driver
+            future.cancel()
+        
+        if scanner:
             scanner.close()
-            del active_scanners[session_id]
         
-        if session_id in scan_sessions:
-            scan_sessions[session_id]['status'] = 'stopped'
-            scan_sessions[session_id]['message'] = 'Scan stopped by user'
+        if session_data:
+            with _sess_lock:
+                session_data['status'] = 'stopped'
+                session_data['message'] = 'Scan stopped by user'
+                mark_finished(session_data)
         
         socketio.emit('scan_stopped', {'session_id': session_id}, room=session_id)
         
@@ -179,12 +531,15 @@ def dom_iframe_xpaths():
         if not search_text:
             return jsonify({'error': 'search_text is required'}), 400
 
-        xpaths = find_iframe_xpaths_in_dom(html_source, search_text)
-        return jsonify({
+        xpaths = cached_dom_iframe_xpaths(html_source, search_text)
+        return orjson_response({
             'success': True,
             'count': len(xpaths),
             'xpaths': xpaths
         })
+    except FutureTimeoutError:
+        logger.error("DOM-only XPath timed out after %ss", DOM_PARSE_TIMEOUT)
+        return jsonify({'error': f'DOM parsing timed out after {DOM_PARSE_TIMEOUT}s'}), 504
     except Exception as e:
         logger.error(f"DOM-only XPath error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -192,21 +547,29 @@ def dom_iframe_xpaths():
 def run_scan_background(session_id, url, html_source, search_text, headless):
     """Run comprehensive scan in background thread."""
     scanner = None
+    driver = None
+    ws_handler = None
+    emitter = SessionEmitter(session_id)
+    session_emitters[session_id] = emitter
     
     try:
         # Update status
         update_scan_status(session_id, 'initializing', 5, 'Setting up browser...')
         
-        # Initialize scanner
-        scanner = ComprehensiveIframeScanner(headless=headless, timeout=20)
-        active_scanners[session_id] = scanner
+        # Initialize scanner; headless scans borrow a warm driver from the pool
+        if headless:
+            driver = driver_pool.acquire()
+        scanner = ComprehensiveIframeScanner(headless=headless, timeout=20, driver=driver)
+        with _sess_lock:
+            active_scanners[session_id] = scanner
         
         # Add WebSocket logging handler
-        ws_handler = WebSocketHandler(session_id)
+        ws_handler = WebSocketHandler(session_id, emitter)
         ws_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
         scanner.logger.addHandler(ws_handler)
         
         # Notify client that scan is starting
+        emitter.flush()
         socketio.emit('scan_started', {
             'session_id': session_id,
             'input_type': 'url' if url else 'html_source'
@@ -232,12 +595,21 @@ def run_scan_background(session_id, url, html_source, search_text, headless):
         
         # Process and store results
         processed_results = process_scan_results(report)
-        scan_sessions[session_id]['results'] = processed_results
+        with _sess_lock:
+            session_data = scan_sessions.get(session_id)
+            if session_data:
+                session_data['results'] = processed_results
+                # Results never change after completion, so serialize them once
+                # and let repeated polls revalidate against the ETag
+                body = orjson.dumps(results_payload(session_id, session_data), option=orjson.OPT_NON_STR_KEYS)
+                session_data['results_json'] = body
+                session_data['etag'] = hashlib.blake2b(body, digest_size=8).hexdigest()
         
         # Complete
         update_scan_status(session_id, 'completed', 100, 'Scan completed successfully!')
         
-        # Send completion notification
+        # Send completion notification after any pending logs/status
+        emitter.flush()
         socketio.emit('scan_completed', {
             'session_id': session_id,
             'summary': {
@@ -251,10 +623,15 @@ def run_scan_background(session_id, url, html_source, search_text, headless):
         error_msg = str(e)
         logger.error(f"Scan error for session {session_id}: {error_msg}")
         
-        scan_sessions[session_id]['status'] = 'error'
-        scan_sessions[session_id]['error'] = error_msg
-        scan_sessions[session_id]['message'] = f'Error: {error_msg}'
+        with _sess_lock:
+            session_data = scan_sessions.get(session_id)
+            if session_data:
+                session_data['status'] = 'error'
+                session_data['error'] = error_msg
+                session_data['message'] = f'Error: {error_msg}'
+                mark_finished(session_data)
         
+        emitter.flush()
         socketio.emit('scan_error', {
             'session_id': session_id,
             'error': error_msg
@@ -262,70 +639,132 @@ def run_scan_background(session_id, url, html_source, search_text, headless):
         
     finally:
         # Clean up
-        if scanner:
+        if scanner and ws_handler:
+            scanner.logger.removeHandler(ws_handler)
+        
+        if driver is not None:
+            driver_pool.release(driver)
+        elif scanner:
             scanner.close()
         
-        if session_id in active_scanners:
-            del active_scanners[session_id]
+        with _sess_lock:
+            active_scanners.pop(session_id, None)
+        
+        emitter.close()
+        session_emitters.pop(session_id, None)
+
+# Statuses after which a scan's elapsed time stops counting
+FINAL_STATUSES = frozenset({'completed', 'error', 'stopped'})
+
+def mark_finished(session_data):
+    """Record when a session reached its first final status; call with _sess_lock held."""
+    if session_data['end_time_ns'] is None:
+        session_data['end_time_ns'] = time.monotonic_ns()
 
 def update_scan_status(session_id, status, progress, message):
     """Update scan status and notify clients."""
-    if session_id in scan_sessions:
-        scan_sessions[session_id]['status'] = status
-        scan_sessions[session_id]['progress'] = progress
-        scan_sessions[session_id]['message'] = message
-        
-        socketio.emit('status_update', {
-            'session_id': session_id,
-            'status': status,
-            'progress': progress,
-            'message': message
-        }, room=session_id)
+    with _sess_lock:
+        session_data = scan_sessions.get(session_id)
+        if not session_data:
+            return
+        prev = (session_data['status'], session_data['progress'], session_data['message'])
+        if (status, progress, message) == prev:
+            # No-op transition; clients already have this state
+            return
+        session_data['status'] = status
+        session_data['progress'] = progress
+        session_data['message'] = message
+        if status in FINAL_STATUSES:
+            mark_finished(session_data)
+    
+    payload = {
+        'session_id': session_id,
+        'status': status,
+        'progress': progress,
+        'message': message
+    }
+    emitter = session_emitters.get(session_id)
+    if emitter:
+        # Coalesced: only the latest status per flush reaches the client
+        emitter.set_status(payload)
+    else:
+        socketio.emit('status_update', payload, room=session_id)
+
+def evict_expired_scanners():
+    """Periodically drop expired sessions and close scanners whose session is gone."""
+    while True:
+        socketio.sleep(SESSION_EVICT_INTERVAL)
+        with _sess_lock:
+            scan_sessions.expire()
+            orphaned = [
+                (session_id, scanner) for session_id, scanner in active_scanners.items()
+                if session_id not in scan_sessions
+            ]
+            for session_id, _ in orphaned:
+                del active_scanners[session_id]
+        
+        for session_id, scanner in orphaned:
+            logger.info(f"Closing scanner for expired session {session_id}")
+            scanner.close()
+
+_evictor_started = False
+
+def ensure_evictor():
+    """Start the eviction loop with the first session, not at import.
+
+    Spawned DOM parse workers re-import the main script when the app is run
+    as `python web_app.py`; starting here keeps the loop out of them.
+    """
+    global _evictor_started
+    with _sess_lock:
+        if _evictor_started:
+            return
+        _evictor_started = True
+    socketio.start_background_task(evict_expired_scanners)
 
 def process_scan_results(report):
     """Process raw scan results for frontend consumption."""
     try:
         # Extract summary information
         summary = report.get('scan_summary', {})
-        search_results = report.get('search_results', {})
+        search_results = report.get('search_results') or {}
         iframe_details = report.get('iframe_details', [])
+        summary_get = summary.get
+        search_results_get = search_results.get
+        locs = search_results_get('locations') or []
+        join = ' → '.join
         
         # Process iframe information
-        processed_iframes = []
-        for iframe in iframe_details:
-            processed_iframes.append({
-                'path': iframe['hierarchy_path'],
-                'id': iframe.get('id', ''),
-                'name': iframe.get('name', ''),
-                'src': iframe.get('src', ''),
-                'title': iframe.get('title', ''),
-                'class': iframe.get('class', ''),
-                'accessible': iframe['is_accessible'],
-                'error': iframe.get('error_message', ''),
-                'preview': iframe.get('content_preview', ''),
-                'matches_found': iframe.get('text_found_count', 0)
-            })
+        processed_iframes = [{
+            'path': iframe['hierarchy_path'],
+            'id': iframe.get('id', ''),
+            'name': iframe.get('name', ''),
+            'src': iframe.get('src', ''),
+            'title': iframe.get('title', ''),
+            'class': iframe.get('class', ''),
+            'accessible': iframe['is_accessible'],
+            'error': iframe.get('error_message', ''),
+            'preview': iframe.get('content_preview', ''),
+            'matches_found': iframe.get('text_found_count', 0)
+        } for iframe in iframe_details]
         
         # Process search results
-        processed_matches = []
-        if search_results and search_results.get('locations'):
-            for match in search_results['locations']:
-                processed_matches.append({
-                    'location_path': ' → '.join(match['location_path']),
-                    'element_tag': match.get('tag_name', ''),
-                    'element_text': match.get('element_text', ''),
-                    'element_xpath': match.get('element_xpath', ''),
-                    'strategy_used': match.get('strategy_used', ''),
-                    'found_text': match.get('found_text', '')
-                })
+        processed_matches = [{
+            'location_path': join(match['location_path']),
+            'element_tag': match.get('tag_name', ''),
+            'element_text': match.get('element_text', ''),
+            'element_xpath': match.get('element_xpath', ''),
+            'strategy_used': match.get('strategy_used', ''),
+            'found_text': match.get('found_text', '')
+        } for match in locs]
         
         return {
             'summary': {
-                'total_iframes': summary.get('total_iframes_found', 0),
-                'accessible_iframes': summary.get('accessible_iframes', 0),
-                'inaccessible_iframes': summary.get('inaccessible_iframes', 0),
-                'total_matches': search_results.get('total_locations_found', 0) if search_results else 0,
-                'search_text': search_results.get('search_text', '') if search_results else ''
+                'total_iframes': summary_get('total_iframes_found', 0),
+                'accessible_iframes': summary_get('accessible_iframes', 0),
+                'inaccessible_iframes': summary_get('inaccessible_iframes', 0),
+                'total_matches': search_results_get('total_locations_found', 0),
+                'search_text': search_results_get('search_text', '')
             },
             'iframes': processed_iframes,
             'matches': processed_matches
@@ -369,23 +808,26 @@ def handle_leave_scan(data):
         leave_room(session_id)
         emit('left_scan', {'session_id': session_id})
 
+STARTUP_BANNER = """🚀 Comprehensive Iframe Scanner - Web Frontend
+""" + "=" * 60 + """
+📱 Access the application at: http://localhost:5000
+🔧 Features:
+   • Modern responsive UI
+   • Real-time progress updates
+   • Support for URL and HTML/DOM input
+   • Comprehensive iframe discovery
+   • Advanced text search capabilities
+   • Live logging and results
+""" + "=" * 60 + "\n"
+
 if __name__ == '__main__':
     # Create templates and static directories
     os.makedirs('templates', exist_ok=True)
     os.makedirs('static/css', exist_ok=True)
     os.makedirs('static/js', exist_ok=True)
     
-    print("🚀 Comprehensive Iframe Scanner - Web Frontend")
-    print("=" * 60)
-    print("📱 Access the application at: http://localhost:5000")
-    print("🔧 Features:")
-    print("   • Modern responsive UI")
-    print("   • Real-time progress updates")
-    print("   • Support for URL and HTML/DOM input")
-    print("   • Comprehensive iframe discovery")
-    print("   • Advanced text search capabilities")
-    print("   • Live logging and results")
-    print("=" * 60)
+    sys.stdout.write(STARTUP_BANNER)
+    sys.stdout.flush()
     
     # Run the application
     socketio.run(app, debug=True, host='0.0.0.0', port=5000)